@@ -28,7 +28,9 @@ between consonant and dissonant intervals in music theory.
 
 Dependencies
 ------------
-None - uses only Python standard library
+Standard library only for core functionality.
+Optional: numpy for vectorized analysis of large N, numba for
+compiled consonance counts (not required)
 
 License
 -------
@@ -43,14 +45,34 @@ __version__ = "1.0.0"
 __author__ = "Masamichi Iizumi,
 """
 
+import math
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; fall back to pure Python
+    np = None
+
+# Rows below which the numpy kernels are used even with numba installed:
+# importing numba and loading its compiled kernels costs more than it
+# saves on smaller batches
+_NUMBA_MIN_ROWS = 1_000_000
+
+
 def continued_fraction(x, depth=10):
     """
     Compute continued fraction expansion of a real number.
     
     Parameters
     ----------
-    x : float
-        Real number to expand
+    x : float or Fraction
+        Real number to expand. A Fraction is expanded exactly via
+        continued_fraction_rational().
     depth : int, optional
         Maximum depth of expansion (default: 10)
     
@@ -67,6 +89,9 @@ def continued_fraction(x, depth=10):
     >>> continued_fraction(0.5, depth=5)
     [0, 2]
     
+    >>> continued_fraction(Fraction(30, 77))
+    [0, 2, 1, 1, 3, 4]
+    
     Notes
     -----
     For a real number x, the continued fraction is:
@@ -75,6 +100,9 @@ def continued_fraction(x, depth=10):
     The algorithm terminates when x becomes sufficiently small (< 1e-10)
     or when the specified depth is reached.
     """
+    if isinstance(x, Fraction):
+        return continued_fraction_rational(x.numerator, x.denominator, depth)
+    
     result = []
     for _ in range(depth):
         if abs(x) < 1e-10:
@@ -88,6 +116,293 @@ def continued_fraction(x, depth=10):
     return result
 
 
+def continued_fraction_rational(num, den, depth=10):
+    """
+    Compute the continued fraction expansion of a rational num/den.
+    
+    Uses the integer Euclidean algorithm, so every coefficient is
+    exact and no floating-point tolerance is needed.
+    
+    Parameters
+    ----------
+    num : int
+        Numerator (non-negative)
+    den : int
+        Denominator (positive)
+    depth : int, optional
+        Maximum depth of expansion (default: 10)
+    
+    Returns
+    -------
+    list of int
+        Continued fraction coefficients [a₀, a₁, a₂, ...]
+    
+    Examples
+    --------
+    >>> continued_fraction_rational(30, 77)
+    [0, 2, 1, 1, 3, 4]
+    
+    >>> continued_fraction_rational(1, 2, depth=5)
+    [0, 2]
+    
+    Notes
+    -----
+    Every digit ratio d_p / d_N is rational, so all callers in this
+    module use this function. continued_fraction() remains available
+    for irrational inputs.
+    """
+    result = []
+    for _ in range(depth):
+        if den == 0:
+            break
+        a, r = divmod(num, den)
+        result.append(a)
+        num, den = den, r
+    return result
+
+
+def _cf_cached(num, den, depth):
+    """
+    Memoized continued_fraction_rational(), returned as a tuple.
+    
+    Keyed by the reduced fraction, so equal ratios such as 10/20 and
+    25/50 share one cache entry.
+    """
+    g = math.gcd(num, den)
+    return _cf_reduced(num // g, den // g, depth)
+
+
+@lru_cache(maxsize=4096)
+def _cf_reduced(num, den, depth):
+    """Cache behind _cf_cached(); num/den must be in lowest terms."""
+    return tuple(continued_fraction_rational(num, den, depth))
+
+
+def _continued_fractions_batch(num, den, depth=10):
+    """
+    Vectorized continued_fraction_rational() over arrays (requires numpy).
+    
+    Parameters
+    ----------
+    num : numpy.ndarray
+        1-D integer array of numerators
+    den : int or numpy.ndarray
+        Denominator(s), broadcast against num
+    depth : int, optional
+        Maximum depth of expansion (default: 10)
+    
+    Returns
+    -------
+    numpy.ndarray
+        Integer array of shape (len(num), depth). Row i holds the
+        coefficients of continued_fraction_rational(num[i], den[i], depth),
+        padded with zeros once the expansion terminates.
+    """
+    num, den = np.broadcast_arrays(np.asarray(num, dtype=np.int64),
+                                   np.asarray(den, dtype=np.int64))
+    cf = np.zeros((len(num), depth), dtype=np.int64)
+    for k in range(depth):
+        active = den > 0
+        a = np.where(active, num // np.where(active, den, 1), 0)
+        cf[:, k] = a
+        num, den = (np.where(active, den, num),
+                    np.where(active, num - a * den, 0))
+    return cf
+
+
+@lru_cache(maxsize=None)
+def _numba_kernels():
+    """
+    Compile the numba kernels on first use.
+    
+    numba is imported here rather than at module level so that small
+    analyses never pay for it.
+    
+    Returns
+    -------
+    tuple of callable or None
+        (cf_batch, cf_kappas), or None when numba is not installed
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:  # numba is optional; fall back to numpy
+        return None
+    
+    @njit(parallel=True, cache=True)
+    def cf_batch(ps, qs, depth):
+        """Compiled continued_fractions_batch(), parallel over rows."""
+        n = ps.shape[0]
+        out = np.full((n, depth), -1, np.int64)
+        for i in prange(n):
+            p, q = ps[i], qs[i]
+            for k in range(depth):
+                a = p // q
+                out[i, k] = a
+                r = p - a * q
+                if r == 0:
+                    break
+                p, q = q, r
+        return out
+    
+    @njit(parallel=True, cache=True)
+    def cf_kappas(N_digits, depth):
+        """Compiled _cf_kappas(), parallel over p_digits."""
+        M = N_digits // 2
+        out = np.zeros(M, np.int64)
+        for i in prange(M):
+            # a₀ = 0 since p < N; expand N / p for a₁, a₂, ...
+            num, den = N_digits, i + 1
+            k = 0
+            for _ in range(depth - 1):
+                if den == 0:
+                    break
+                a = num // den
+                if a > k:
+                    k = a
+                num, den = den, num - a * den
+            out[i] = k
+        return out
+    
+    return cf_batch, cf_kappas
+
+
+def continued_fractions_batch(pqs, depth=10):
+    """
+    Compute continued fraction expansions of many rationals at once.
+    
+    Parameters
+    ----------
+    pqs : array_like of int, shape (n, 2)
+        Rows of (numerator, denominator), with numerator ≥ 0 and
+        denominator > 0
+    depth : int, optional
+        Maximum depth of expansion (default: 10)
+    
+    Returns
+    -------
+    numpy.ndarray
+        int64 array of shape (n, depth). Row i holds the coefficients
+        of continued_fraction_rational(*pqs[i], depth), followed by -1
+        once the expansion terminates.
+    
+    Examples
+    --------
+    >>> continued_fractions_batch([(30, 77), (1, 2)], depth=8)
+    array([[ 0,  2,  1,  1,  3,  4, -1, -1],
+           [ 0,  2, -1, -1, -1, -1, -1, -1]])
+    
+    Notes
+    -----
+    Requires numpy. Batches of at least _NUMBA_MIN_ROWS rows are
+    expanded by a compiled numba kernel in parallel when numba is
+    installed; everything else by a vectorized numpy loop.
+    
+    Raises
+    ------
+    ValueError
+        If a numerator is negative or a denominator is not positive
+    """
+    if np is None:
+        raise ImportError("continued_fractions_batch() requires numpy")
+    
+    pqs = np.asarray(pqs, dtype=np.int64).reshape(-1, 2)
+    if (pqs[:, 0] < 0).any() or (pqs[:, 1] <= 0).any():
+        raise ValueError("continued_fractions_batch() requires "
+                         "numerators >= 0 and denominators > 0")
+    
+    kernels = _numba_kernels() if len(pqs) >= _NUMBA_MIN_ROWS else None
+    if kernels is not None:
+        return kernels[0](pqs[:, 0], pqs[:, 1], depth)
+    
+    cf = _continued_fractions_batch(pqs[:, 0], pqs[:, 1], depth)
+    # Only a₀ can be zero in an expansion; later zeros are padding
+    cf[:, 1:][cf[:, 1:] == 0] = -1
+    return cf
+
+
+def _cf_kappas(N_digits, depth=10):
+    """
+    Consonance degree κ of p / N_digits for p = 1 .. N_digits // 2.
+    
+    Same values as the Pattern.kappa fields from _compute_patterns(),
+    without building the records.
+    
+    Returns
+    -------
+    numpy.ndarray or list of int
+        κ for each p_digits, in order (a list when numpy is unavailable)
+    """
+    if np is not None:
+        if N_digits // 2 >= _NUMBA_MIN_ROWS:
+            kernels = _numba_kernels()
+            if kernels is not None:
+                return kernels[1](N_digits, depth)
+        p = np.arange(1, N_digits // 2 + 1)
+        cf = _continued_fractions_batch(p, N_digits, depth)
+        return cf[:, 1:].max(axis=1, initial=0)
+    return [p.kappa for p in _compute_patterns(N_digits)]
+
+
+class Pattern(namedtuple('Pattern', 'p_digits ratio cf kappa')):
+    """
+    Consonance data for one factor digit count.
+    
+    A slotted record whose fields can be read as attributes (p.kappa)
+    or by key (p['kappa']).
+    
+    Attributes
+    ----------
+    p_digits : int
+        Factor digit count
+    ratio : float
+        Digit ratio (p_digits / N_digits)
+    cf : tuple of int
+        Continued fraction coefficients
+    kappa : int
+        Consonance degree (max CF coefficient)
+    """
+    __slots__ = ()
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return super().__getitem__(key)
+
+
+@lru_cache(maxsize=64)
+def _compute_patterns(N_digits):
+    """
+    Build the Pattern for every p_digits = 1 .. N_digits // 2.
+    
+    The result does not depend on the consonance threshold, so it is
+    cached and shared by threshold sweeps and summary_table().
+    """
+    if np is not None:
+        # Expand all ratios at once instead of one Python call per ratio
+        p = np.arange(1, N_digits // 2 + 1)
+        cf = continued_fractions_batch(
+            np.column_stack([p, np.full_like(p, N_digits)]), depth=10)
+        
+        # Terminated positions hold the -1 sentinel
+        kappas = cf[:, 1:].max(axis=1, initial=0)
+        lengths = np.count_nonzero(cf != -1, axis=1)
+        
+        return tuple(
+            Pattern(p_digits, ratio, tuple(row[:n]), kappa)
+            for p_digits, ratio, row, n, kappa in zip(
+                p.tolist(), (p / N_digits).tolist(), cf.tolist(),
+                lengths.tolist(), kappas.tolist()))
+    
+    patterns = []
+    for p_digits in range(1, N_digits // 2 + 1):
+        cf = _cf_cached(p_digits, N_digits, 10)
+        
+        # Consonance degree: maximum coefficient (excluding a₀)
+        kappa = max(cf[1:]) if len(cf) > 1 else 0
+        patterns.append(Pattern(p_digits, p_digits / N_digits, cf, kappa))
+    return tuple(patterns)
+
+
 def analyze_digit_consonance(N_digits, kappa_threshold=4):
     """
     Analyze consonance patterns for all possible digit ratios.
@@ -113,19 +428,20 @@ def analyze_digit_consonance(N_digits, kappa_threshold=4):
         - 'N_digits': input digit count
         - 'threshold': threshold used
         
-        Each pattern is a dict with:
+        Each pattern is a Pattern record with fields (also readable
+        by key, e.g. p['kappa']):
         - 'p_digits': factor digit count
         - 'ratio': digit ratio (p_digits / N_digits)
-        - 'cf': continued fraction coefficients
+        - 'cf': continued fraction coefficients (tuple)
         - 'kappa': consonance degree (max CF coefficient)
     
     Examples
     --------
     >>> result = analyze_digit_consonance(77)
     >>> len(result['consonant'])
-    10
+    9
     >>> len(result['dissonant'])
-    28
+    29
     
     Notes
     -----
@@ -136,40 +452,37 @@ def analyze_digit_consonance(N_digits, kappa_threshold=4):
     
     The threshold κ = 4 corresponds to the classical boundary
     between consonant and dissonant intervals in music theory.
+    
+    The patterns are computed once per N_digits by _compute_patterns(),
+    and the partition once per (N_digits, kappa_threshold) by
+    _partition_patterns(); the returned lists are fresh copies.
+    """
+    consonant, dissonant = _partition_patterns(N_digits, kappa_threshold)
+    
+    return {
+        'consonant': list(consonant),
+        'dissonant': list(dissonant),
+        'N_digits': N_digits,
+        'threshold': kappa_threshold
+    }
+
+
+@lru_cache(maxsize=256)
+def _partition_patterns(N_digits, kappa_threshold):
+    """
+    Split the patterns for N_digits into (consonant, dissonant) tuples.
     """
     consonant = []
     dissonant = []
     
-    # Iterate through all possible factor digit counts
-    for p_digits in range(1, N_digits // 2 + 1):
-        ratio = p_digits / N_digits
-        
-        # Compute continued fraction expansion
-        cf = continued_fraction(ratio, depth=10)
-        
-        # Consonance degree: maximum coefficient (excluding a₀)
-        kappa = max(cf[1:]) if len(cf) > 1 else 0
-        
-        # Create pattern dictionary
-        pattern = {
-            'p_digits': p_digits,
-            'ratio': ratio,
-            'cf': cf,
-            'kappa': kappa
-        }
-        
-        # Classify as consonant or dissonant
-        if kappa <= kappa_threshold:
+    # Classify as consonant or dissonant
+    for pattern in _compute_patterns(N_digits):
+        if pattern.kappa <= kappa_threshold:
             consonant.append(pattern)
         else:
             dissonant.append(pattern)
     
-    return {
-        'consonant': consonant,
-        'dissonant': dissonant,
-        'N_digits': N_digits,
-        'threshold': kappa_threshold
-    }
+    return tuple(consonant), tuple(dissonant)
 
 
 def print_analysis(result, max_display=None):
@@ -192,55 +505,64 @@ def print_analysis(result, max_display=None):
     """
     N = result['N_digits']
     threshold = result['threshold']
-    
-    print(f"\n{'='*70}")
-    print(f"Digit Consonance Analysis: N = {N} digits")
-    print(f"Consonance threshold: κ ≤ {threshold}")
-    print(f"{'='*70}\n")
-    
-    # Consonant patterns
     consonant = result['consonant']
-    display_cons = consonant[:max_display] if max_display else consonant
+    dissonant = result['dissonant']
     
-    print(f"♪ Consonant patterns (κ ≤ {threshold}): {len(consonant)} total")
-    print("-" * 70)
-    for p in display_cons:
-        cf_str = str(p['cf'][:6]) if len(p['cf']) > 6 else str(p['cf'])
-        print(f"  {p['p_digits']:3d} / {N:3d} digits = {p['ratio']:6.4f}  "
-              f"CF: {cf_str:30s}  κ = {p['kappa']}")
+    # Build the whole report and write it once
+    lines = [f"\n{'='*70}",
+             f"Digit Consonance Analysis: N = {N} digits",
+             f"Consonance threshold: κ ≤ {threshold}",
+             f"{'='*70}\n"]
     
-    if max_display and len(consonant) > max_display:
-        print(f"  ... and {len(consonant) - max_display} more")
+    # Consonant patterns
+    lines.append(f"♪ Consonant patterns (κ ≤ {threshold}): {len(consonant)} total")
+    lines.append("-" * 70)
+    lines.extend(_pattern_rows(consonant, N, max_display))
     
     # Dissonant patterns
-    dissonant = result['dissonant']
-    display_dis = dissonant[:max_display] if max_display else dissonant
-    
-    print(f"\n♫ Dissonant patterns (κ > {threshold}): {len(dissonant)} total")
-    print("-" * 70)
-    for p in display_dis:
-        cf_str = str(p['cf'][:6]) if len(p['cf']) > 6 else str(p['cf'])
-        print(f"  {p['p_digits']:3d} / {N:3d} digits = {p['ratio']:6.4f}  "
-              f"CF: {cf_str:30s}  κ = {p['kappa']}")
-    
-    if max_display and len(dissonant) > max_display:
-        print(f"  ... and {len(dissonant) - max_display} more")
+    lines.append(f"\n♫ Dissonant patterns (κ > {threshold}): {len(dissonant)} total")
+    lines.append("-" * 70)
+    lines.extend(_pattern_rows(dissonant, N, max_display))
     
-    print(f"\n{'='*70}\n")
+    lines.append(f"\n{'='*70}\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _pattern_rows(patterns, N, max_display=None):
+    """Formatted print_analysis() rows, truncated to max_display."""
+    shown = patterns[:max_display] if max_display else patterns
+    rows = [f"  {p.p_digits:3d} / {N:3d} digits = {p.ratio:6.4f}  "
+            f"CF: {_cf_str(p.cf):30s}  κ = {p.kappa}"
+            for p in shown]
+    if max_display and len(patterns) > max_display:
+        rows.append(f"  ... and {len(patterns) - max_display} more")
+    return rows
 
 
-def summary_table(digit_ranges):
+@lru_cache(maxsize=4096)
+def _cf_str(cf):
+    """Display form of a CF tuple: its first six coefficients as a list."""
+    return str(list(cf[:6]))
+
+
+def summary_table(digit_ranges, workers=1):
     """
     Generate summary table for multiple digit ranges.
     
     Parameters
     ----------
-    digit_ranges : list of int
-        List of N values to analyze
+    digit_ranges : iterable of int
+        N values to analyze; any iterable, including a generator
+    workers : int or None, optional
+        Number of worker processes (default: 1, i.e. in-process).
+        None uses os.cpu_count(). Each N is independent, but the
+        per-N work is small, so a pool only pays off for long lists
+        of large N.
     
     Examples
     --------
     >>> summary_table([50, 77, 100, 154, 256])
+    >>> summary_table(range(1000, 5000), workers=None)
     """
     print(f"\n{'='*60}")
     print(f"Summary: Consonance Distribution Across Digit Ranges")
@@ -248,10 +570,15 @@ def summary_table(digit_ranges):
     print(f"{'N (digits)':>12} | {'Consonant':>12} | {'Dissonant':>12} | {'Ratio':>8}")
     print(f"{'-'*12}-+-{'-'*12}-+-{'-'*12}-+-{'-'*8}")
     
-    for N in digit_ranges:
-        result = analyze_digit_consonance(N)
-        n_cons = len(result['consonant'])
-        n_dis = len(result['dissonant'])
+    digit_ranges = list(digit_ranges)
+    workers = workers or os.cpu_count() or 1
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            counts = list(ex.map(_consonance_counts, digit_ranges))
+    else:
+        counts = map(_consonance_counts, digit_ranges)
+    
+    for N, (n_cons, n_dis) in zip(digit_ranges, counts):
         ratio = n_cons / (n_cons + n_dis) if (n_cons + n_dis) > 0 else 0
         
         print(f"{N:12d} | {n_cons:12d} | {n_dis:12d} | {ratio:7.2%}")
@@ -259,6 +586,16 @@ def summary_table(digit_ranges):
     print(f"{'='*60}\n")
 
 
+def _consonance_counts(N_digits):
+    """(consonant, dissonant) pattern counts for summary_table()."""
+    kappas = _cf_kappas(N_digits)
+    if np is not None:
+        n_cons = int(np.count_nonzero(kappas <= 4))
+    else:
+        n_cons = sum(1 for kappa in kappas if kappa <= 4)
+    return n_cons, len(kappas) - n_cons
+
+
 def print_lemma_statement():
     """
     Print the formal statement of Tamaki's Lemma.
@@ -348,6 +685,24 @@ def verify_tamaki_lemma(digit_ranges=None, p_digit_samples=None):
     print("\nLemma: For r = d_p / d_N, the first CF coefficient a₁ = ⌊d_N / d_p⌋")
     print("=" * 70)
     
+    # All (N, p) pairs under test; skip p larger than N/2
+    pairs = [(N_digits, p_digits)
+             for N_digits in digit_ranges
+             for p_digits in p_digit_samples
+             if p_digits < N_digits // 2]
+    
+    # Actual first CF coefficients (a₁), computed for every pair at once.
+    # a₁ only needs the first two steps of the expansion.
+    if np is not None and pairs:
+        Ns, ps = np.array(pairs, dtype=np.int64).T
+        a1_values = _continued_fractions_batch(ps, Ns, depth=2)[:, 1].tolist()
+    else:
+        a1_values = []
+        for N_digits, p_digits in pairs:
+            cf = _cf_cached(p_digits, N_digits, 2)
+            a1_values.append(cf[1] if len(cf) > 1 else 0)
+    a1_values = iter(a1_values)
+    
     for N_digits in digit_ranges:
         print(f"\nTest case: N = {N_digits} digits")
         print(f"{'d_p':<6} {'d_N/d_p':<10} {'⌊d_N/d_p⌋':<12} {'a₁':<8} {'Match'}")
@@ -356,21 +711,14 @@ def verify_tamaki_lemma(digit_ranges=None, p_digit_samples=None):
         case_results = []
         
         for p_digits in p_digit_samples:
-            # Skip if p would be larger than N/2
             if p_digits >= N_digits // 2:
                 continue
             
-            # Compute digit ratio
-            ratio = p_digits / N_digits
-            
-            # Compute continued fraction
-            cf = continued_fraction(ratio, depth=5)
-            
             # Expected: floor(N / p)
             a1_expected = N_digits // p_digits
             
             # Actual: first CF coefficient (a₁)
-            a1_actual = cf[1] if len(cf) > 1 else 0
+            a1_actual = next(a1_values)
             
             # Check match
             match = (a1_expected == a1_actual)
@@ -431,7 +779,7 @@ if __name__ == "__main__":
     # Example 2: Detailed look at a specific ratio
     print("\nExample 2: Detailed analysis of 20/77 ratio")
     ratio_20_77 = 20 / 77
-    cf_20_77 = continued_fraction(ratio_20_77)
+    cf_20_77 = continued_fraction_rational(20, 77)
     kappa_20_77 = max(cf_20_77[1:]) if len(cf_20_77) > 1 else 0
     
     print(f"Ratio: 20/77 = {ratio_20_77:.6f}")
@@ -16,13 +16,62 @@ License: Apache 2.0 (see LICENSE file in repository root)
 import argparse
 import json
 import math
+import os
+import shelve
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
-from mpmath import mp, zetazero
+import numpy as np
+from mpmath import fp, mp, zetazero
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to streamed json
+    orjson = None
 
-def build_zeta_zero_table(K: int, T: float, dps: int = 80, progress_every: int = 50):
+
+# Persistent γ cache keyed by "n:dps" or "n:fp" (shelve may add a file suffix)
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "lambda3_zeros"
+
+
+def _one_zero(n: int, dps: int, fast_fp: bool = False):
+    """
+    Compute γ_n of the n-th zero (runs in a worker process).
+
+    mpmath precision is per-process state, so each worker sets mp.dps.
+    With fast_fp, mpmath's hardware double-precision context is used.
+    """
+    if fast_fp:
+        return n, float(fp.zetazero(n).imag)
+    mp.dps = dps
+    rho = zetazero(n)                    # ρ_n = 1/2 + i*γ_n
+    return n, float(rho.imag)
+
+
+def zero_weights(gammas, T: float):
+    """
+    Weights w_n = |1/ρ_n| * exp(-(γ_n/T)^2) for an array of γ values.
+
+    - |1/ρ| provides natural high-frequency damping
+    - Gaussian controls bandwidth
+
+    All K weights are computed as whole-array operations on one
+    contiguous float64 buffer, so np.exp runs once over every zero.
+    """
+    g = np.ascontiguousarray(gammas, dtype=np.float64)
+    w = g / T
+    np.square(w, out=w)
+    np.negative(w, out=w)
+    np.exp(w, out=w)
+    w /= np.hypot(0.5, g)
+    return w
+
+
+def build_zeta_zero_table(K: int, T: float, dps: int = 80, progress_every: int = 50,
+                          workers: int = None, cache_path=DEFAULT_CACHE_PATH,
+                          fast_fp: bool = False):
     """
     Generate weighted table of first K non-trivial zeros of Riemann ζ-function.
 
@@ -36,6 +85,16 @@ def build_zeta_zero_table(K: int, T: float, dps: int = 80, progress_every: int =
         Decimal precision for mpmath (default: 80)
     progress_every : int
         Progress display interval (0 to disable)
+    workers : int, optional
+        Number of worker processes (default: os.cpu_count())
+    cache_path : str or Path, optional
+        Shelve file caching γ values across runs (None to disable).
+        Weights are always recomputed, so T can change freely.
+    fast_fp : bool, optional
+        Use mpmath.fp (double precision) instead of dps digits. γ is
+        stored as a float either way, so the extra digits are otherwise
+        discarded; fp is much faster but can lose accuracy on very
+        high zeros (agrees to ~1e-13 for K ≤ 2000).
 
     Returns
     -------
@@ -44,26 +103,46 @@ def build_zeta_zero_table(K: int, T: float, dps: int = 80, progress_every: int =
     meta : dict
         Metadata including RMS, weight range, etc.
     """
-    print(f"🔍 Computing ζ-zeros... (K={K}, T={T}, dps={dps})")
-    mp.dps = dps
+    workers = workers or os.cpu_count() or 1
+    precision = "fp" if fast_fp else dps
+    print(f"🔍 Computing ζ-zeros... (K={K}, T={T}, dps={precision}, workers={workers})")
+
+    cache = None
+    if cache_path:
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        cache = shelve.open(str(cache_path))
 
-    zeros = []
-    w_sq_sum = 0.0
+    try:
+        gammas_by_n = {}
+        if cache is not None:
+            for n in range(1, K + 1):
+                key = f"{n}:{precision}"
+                if key in cache:
+                    gammas_by_n[n] = cache[key]
+            if gammas_by_n:
+                print(f"  Cached: {len(gammas_by_n)}/{K}", file=sys.stderr)
 
-    for n in range(1, K + 1):
-        if progress_every and n % progress_every == 0:
-            print(f"  Progress: {n}/{K}", file=sys.stderr)
+        missing = [n for n in range(1, K + 1) if n not in gammas_by_n]
+        if missing:
+            # Each zero is independent; map preserves the order of n
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                results = ex.map(partial(_one_zero, dps=dps, fast_fp=fast_fp),
+                                 missing, chunksize=8)
+                for done, (n, gamma) in enumerate(results, start=1):
+                    if progress_every and done % progress_every == 0:
+                        print(f"  Progress: {done}/{len(missing)}", file=sys.stderr)
 
-        rho = zetazero(n)                # ρ_n = 1/2 + i*γ_n
-        gamma = float(rho.imag)
+                    gammas_by_n[n] = gamma
+                    if cache is not None:
+                        cache[f"{n}:{precision}"] = gamma
+    finally:
+        if cache is not None:
+            cache.close()
 
-        # Weight: |1/ρ| * exp(-(γ/T)^2)
-        # |1/ρ| provides natural high-frequency damping
-        # Gaussian controls bandwidth
-        w = (1.0 / math.hypot(0.5, gamma)) * math.exp(- (gamma / T) ** 2)
+    g = np.array([gammas_by_n[n] for n in range(1, K + 1)], dtype=np.float64)
 
-        w_sq_sum += w * w
-        zeros.append({"n": n, "gamma": gamma, "w": w})
+    w = zero_weights(g, T)
+    w_sq_sum = float((w * w).sum())
 
     # RMS normalization coefficients
     # rms_raw: simple root-mean-square of weights
@@ -71,36 +150,75 @@ def build_zeta_zero_table(K: int, T: float, dps: int = 80, progress_every: int =
     rms_raw = math.sqrt(max(1e-300, w_sq_sum) / max(1, K))
     rms_cos = math.sqrt(0.5 * max(1e-300, w_sq_sum))
 
-    gammas = [z["gamma"] for z in zeros]
-    ws = [z["w"] for z in zeros]
-
-    # Weighted median of γ (useful for automatic σ_u determination)
-    pairs = sorted(zip(gammas, ws), key=lambda t: t[0])
-    total_w = sum(ws) or 1.0
-    acc = 0.0
-    gamma_med = pairs[-1][0]
-    for g, w in pairs:
-        acc += w
-        if acc >= 0.5 * total_w:
-            gamma_med = g
-            break
+    # Weighted median of γ (useful for automatic σ_u determination).
+    # zetazero(n) is increasing in n, so g is already sorted.
+    assert np.all(np.diff(g) > 0), "γ values must be strictly increasing"
+    cum = np.cumsum(w)
+    total_w = cum[-1] if K and cum[-1] else 1.0
+    idx = min(int(np.searchsorted(cum, 0.5 * total_w)), K - 1)
+    gamma_med = float(g[idx]) if K else None
 
     # Metadata
     meta = {
-        "gamma_min": gammas[0] if gammas else None,
-        "gamma_max": gammas[-1] if gammas else None,
-        "w_min": min(ws) if ws else None,
-        "w_max": max(ws) if ws else None,
+        "gamma_min": float(g[0]) if K else None,
+        "gamma_max": float(g[-1]) if K else None,
+        "w_min": float(w.min()) if K else None,
+        "w_max": float(w.max()) if K else None,
         "w_rms_raw": rms_raw,
         "w_rms_cos": rms_cos,
         "gamma_weighted_median": gamma_med,
-        "effective_K_guess": sum(1 for w in ws if w >= max(ws) * math.exp(-9.0)),  # ~3σ estimate
+        "effective_K_guess": int((w >= w.max() * math.exp(-9.0)).sum()) if K else 0,  # ~3σ estimate
     }
 
+    zeros = [{"n": n, "gamma": gamma, "w": weight}
+             for n, gamma, weight in zip(range(1, K + 1), g.tolist(), w.tolist())]
+
     print(f"✅ Computed {K} zeros successfully!", file=sys.stderr)
     return zeros, meta
 
 
+def write_zeta_zero_table(table: dict, out_path: Path, indent: int = 2):
+    """
+    Write the zero table as JSON.
+
+    Uses orjson when it is installed and the indent is supported
+    (compact or 2); it serializes the whole document to one bytes
+    object in native code, which is fast but holds the output in
+    memory. Otherwise top-level fields are written with json and the
+    zeros are streamed one compact record per line, without building
+    one large string.
+
+    Parameters
+    ----------
+    table : dict
+        Output structure (scalar fields, "zeros" list, optional "meta")
+    out_path : Path
+        Destination file
+    indent : int or None
+        Indent width (None for compact output)
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent == 2 else 0
+        out_path.write_bytes(orjson.dumps(table, option=option))
+        return
+
+    nl = "" if indent is None else "\n"
+    pad = " " * (indent or 0)
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write("{")
+        for i, (key, value) in enumerate(table.items()):
+            f.write(("," if i else "") + nl + pad + json.dumps(key) + ": ")
+            if key != "zeros":
+                f.write(json.dumps(value, ensure_ascii=False))
+                continue
+            f.write("[")
+            for j, z in enumerate(value):
+                f.write(("," if j else "") + nl + pad * 2)
+                f.write(json.dumps(z, ensure_ascii=False))
+            f.write(nl + pad + "]")
+        f.write(nl + "}" + nl)
+
+
 def main():
     ap = argparse.ArgumentParser(
         description="Riemann ζ-zero Table Generator for Λ³ Framework"
@@ -119,6 +237,14 @@ def main():
                     help="Exclude metadata from output")
     ap.add_argument("--progress-every", type=int, default=50, 
                     help="Progress display interval (0 to disable)")
+    ap.add_argument("--workers", type=int, default=None,
+                    help="Worker processes for zero computation (default: CPU count)")
+    ap.add_argument("--cache", type=str, default=str(DEFAULT_CACHE_PATH),
+                    help="γ cache file reused across runs")
+    ap.add_argument("--no-cache", action="store_true",
+                    help="Do not read or write the γ cache")
+    ap.add_argument("--fast-fp", action="store_true",
+                    help="Use double-precision mpmath.fp (ignores --dps; less accurate for high zeros)")
     args = ap.parse_args()
 
     K = args.K
@@ -127,10 +253,12 @@ def main():
     print("=" * 70)
     print("🌟 Λ³ Riemann ζ-zero Table Generator (Enhanced)")
     print("=" * 70)
-    print(f"K={K}, T={T}, dps={args.dps}")
+    print(f"K={K}, T={T}, dps={'fp' if args.fast_fp else args.dps}")
     
     zeros, meta = build_zeta_zero_table(
-        K=K, T=T, dps=args.dps, progress_every=args.progress_every
+        K=K, T=T, dps=args.dps, progress_every=args.progress_every,
+        workers=args.workers, cache_path=None if args.no_cache else args.cache,
+        fast_fp=args.fast_fp
     )
 
     # Prepare output structure
@@ -139,7 +267,7 @@ def main():
         "version": "2.0",
         "K": K,
         "T": T,
-        "accuracy": f"mpmath dps={args.dps}",
+        "accuracy": "mpmath fp (double)" if args.fast_fp else f"mpmath dps={args.dps}",
         "zeros": zeros,
     }
     if not args.no_meta:
@@ -150,8 +278,7 @@ def main():
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     indent = None if args.indent < 0 else args.indent
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(table, f, ensure_ascii=False, indent=indent)
+    write_zeta_zero_table(table, out_path, indent=indent)
 
     # Display statistics
     print("\n📊 Statistics:")
@@ -14,39 +14,118 @@ regardless of the base used to count digits.
 """
 
 import math
+from functools import lru_cache
+
+# log_base(2) for the bases compared in this module
+_LOG2_IN_BASE = {b: math.log(2) / math.log(b) for b in (2, 3, 7, 8, 10, 12, 16, 60)}
 
 def digit_count(n, base=10):
-    """Count digits of n in given base."""
+    """Count digits of n in given base (exact for arbitrarily large n)."""
     if n <= 0:
         return 1
-    return int(math.log(n, base)) + 1
+    if base == 2:
+        return n.bit_length()
+    if base == 10:
+        return len(str(n))
+    if base == 16:
+        return (n.bit_length() + 3) // 4
+    # Float estimate from the bit length, then correct it exactly
+    log2_in_base = _LOG2_IN_BASE.get(base)
+    if log2_in_base is None:
+        log2_in_base = math.log(2) / math.log(base)
+    k = int((n.bit_length() - 1) * log2_in_base)
+    power = base ** k
+    while power <= n:
+        k += 1
+        power *= base
+    return k
 
-def continued_fraction(x, depth=10):
-    """Compute continued fraction expansion."""
+def continued_fraction_rational(num, den, depth=10):
+    """Compute the exact continued fraction expansion of num/den."""
     result = []
     for _ in range(depth):
-        if abs(x) < 1e-10:
+        if den == 0:
             break
-        a = int(x)
+        a, r = divmod(num, den)
         result.append(a)
-        x = x - a
-        if abs(x) < 1e-10:
-            break
-        x = 1 / x
+        num, den = den, r
     return result
 
-def verify_tamaki_for_base(base, test_cases):
+@lru_cache(maxsize=4096)
+def _cf_cached(num, den, depth):
+    """Memoized expansion of the digit ratio num/den, as a tuple."""
+    return tuple(continued_fraction_rational(num, den, depth))
+
+# Test cases: various semiprimes and their factors
+# Using actual numbers to test across bases
+BASE_TEST_CASES = (
+    (10**20, 10**7),      # 21 digits vs 8 digits (base 10)
+    (10**50, 10**20),     # 51 vs 21
+    (10**77, 10**30),     # 78 vs 31
+    (10**100, 10**33),    # 101 vs 34
+    (2**128, 2**50),      # RSA-like
+    (2**256, 2**100),     # Large crypto
+    (2**1024, 2**400),    # RSA-1024
+    (10**154, 10**60),    # 155 vs 61
+    (7**50, 7**20),       # Base 7 native
+    (16**32, 16**12),     # Hex native
+)
+
+COMPARISON_BASES = (2, 3, 7, 10, 12, 16, 60)  # Binary, ternary, sept, decimal, duodecimal, hex, sexagesimal
+
+# A specific semiprime for the deep analysis
+DEEP_CASE = (2**127 - 1, 2**50)  # Mersenne prime (for illustration), a factor-sized number
+DEEP_BASES = (2, 8, 10, 16)
+
+KAPPA_TEST_PAIRS = (
+    (10**77, 10**30),   # "77-digit RSA"
+    (10**77, 10**20),   # Different ratio
+    (10**100, 10**50),  # Near 1/2
+    (10**100, 10**33),  # ~1/3
+)
+KAPPA_BASES = (2, 10, 16)
+
+# Deepest expansion any report needs; shallower ones slice it
+_GRID_DEPTH = 10
+
+@lru_cache(maxsize=16)
+def _compute_grid(test_cases, bases):
+    """
+    Digit counts and CF expansion for every (base, test case) pair.
+    
+    Returns a dict mapping (base, N, p) to (d_N, d_p, cf), where cf is
+    the depth-10 expansion of d_p / d_N as a tuple. Each integer's digit
+    count is computed once per base, so one grid can feed all reports.
+    """
+    grid = {}
+    for base in bases:
+        counts = {}
+        for N, p in test_cases:
+            for n in (N, p):
+                if n not in counts:
+                    counts[n] = digit_count(n, base)
+            d_N, d_p = counts[N], counts[p]
+            grid[base, N, p] = (d_N, d_p, _cf_cached(d_p, d_N, _GRID_DEPTH))
+    return grid
+
+def verify_tamaki_for_base(base, test_cases, grid=None):
     """
     Verify Tamaki's Lemma for a specific base.
     
+    Digit counts and continued fractions are read from grid (see
+    _compute_grid), which is built for test_cases if not given.
+    
     Returns match rate and details.
     """
+    test_cases = tuple(map(tuple, test_cases))
+    if grid is None:
+        grid = _compute_grid(test_cases, (base,))
+    
     results = []
     
     for N, p in test_cases:
-        # Compute digit counts in the given base
-        d_N = digit_count(N, base)
-        d_p = digit_count(p, base)
+        # Digit counts in the given base
+        d_N, d_p, cf = grid[base, N, p]
         
         if d_p >= d_N or d_p == 0:
             continue
@@ -55,7 +134,7 @@ def verify_tamaki_for_base(base, test_cases):
         ratio = d_p / d_N
         
         # Continued fraction
-        cf = continued_fraction(ratio, depth=8)
+        cf = list(cf[:8])
         
         # Tamaki's prediction
         a1_expected = d_N // d_p
@@ -77,25 +156,13 @@ def verify_tamaki_for_base(base, test_cases):
     
     return results
 
-def run_base_comparison():
+def run_base_comparison(grid=None):
     """Compare Tamaki's Lemma across multiple bases."""
     
-    # Test cases: various semiprimes and their factors
-    # Using actual numbers to test across bases
-    test_cases = [
-        (10**20, 10**7),      # 21 digits vs 8 digits (base 10)
-        (10**50, 10**20),     # 51 vs 21
-        (10**77, 10**30),     # 78 vs 31
-        (10**100, 10**33),    # 101 vs 34
-        (2**128, 2**50),      # RSA-like
-        (2**256, 2**100),     # Large crypto
-        (2**1024, 2**400),    # RSA-1024
-        (10**154, 10**60),    # 155 vs 61
-        (7**50, 7**20),       # Base 7 native
-        (16**32, 16**12),     # Hex native
-    ]
-    
-    bases = [2, 3, 7, 10, 12, 16, 60]  # Binary, ternary, sept, decimal, duodecimal, hex, sexagesimal
+    test_cases = BASE_TEST_CASES
+    bases = COMPARISON_BASES
+    if grid is None:
+        grid = _compute_grid(test_cases, bases)
     
     print("=" * 80)
     print("TAMAKI'S LEMMA: BASE INVARIANCE ANALYSIS")
@@ -112,7 +179,7 @@ def run_base_comparison():
             60: "Sexagesimal"
         }.get(base, f"Base-{base}")
         
-        results = verify_tamaki_for_base(base, test_cases)
+        results = verify_tamaki_for_base(base, test_cases, grid)
         
         if not results:
             continue
@@ -169,7 +236,7 @@ def run_base_comparison():
     
     return base_results
 
-def deep_analysis_specific_ratio():
+def deep_analysis_specific_ratio(grid=None):
     """
     Deep dive: same NUMBER, different base representations.
     
@@ -180,21 +247,19 @@ def deep_analysis_specific_ratio():
     print("DEEP ANALYSIS: Same Number Across Bases")
     print("=" * 80)
     
-    # A specific semiprime
-    N = 2**127 - 1  # Mersenne prime (for illustration)
-    p = 2**50       # A factor-sized number
-    
-    bases = [2, 8, 10, 16]
+    N, p = DEEP_CASE
+    bases = DEEP_BASES
+    if grid is None:
+        grid = _compute_grid((DEEP_CASE,), bases)
     
     print(f"\nN ≈ 2^127")
     print(f"p ≈ 2^50")
     print("-" * 60)
     
     for base in bases:
-        d_N = digit_count(N, base)
-        d_p = digit_count(p, base)
+        d_N, d_p, cf = grid[base, N, p]
         ratio = d_p / d_N
-        cf = continued_fraction(ratio, depth=8)
+        cf = list(cf[:8])
         kappa = max(cf[1:]) if len(cf) > 1 else 0
         
         base_name = {2: "bin", 8: "oct", 10: "dec", 16: "hex"}[base]
@@ -206,7 +271,7 @@ def deep_analysis_specific_ratio():
         print(f"  κ = {kappa}")
         print(f"  a₁ = {cf[1] if len(cf) > 1 else 'N/A'}, ⌊d_N/d_p⌋ = {d_N // d_p}")
 
-def analyze_kappa_invariance():
+def analyze_kappa_invariance(grid=None):
     """
     The big question: Is κ (consonance degree) base-invariant?
     
@@ -220,14 +285,10 @@ def analyze_kappa_invariance():
     print("          depend on the base we use to represent it?")
     print("-" * 60)
     
-    test_pairs = [
-        (10**77, 10**30),   # "77-digit RSA"
-        (10**77, 10**20),   # Different ratio
-        (10**100, 10**50),  # Near 1/2
-        (10**100, 10**33),  # ~1/3
-    ]
-    
-    bases = [2, 10, 16]
+    test_pairs = KAPPA_TEST_PAIRS
+    bases = KAPPA_BASES
+    if grid is None:
+        grid = _compute_grid(test_pairs, bases)
     
     for N, p in test_pairs:
         print(f"\n{'='*50}")
@@ -236,10 +297,9 @@ def analyze_kappa_invariance():
         
         kappas = {}
         for base in bases:
-            d_N = digit_count(N, base)
-            d_p = digit_count(p, base)
+            d_N, d_p, cf = grid[base, N, p]
             ratio = d_p / d_N
-            cf = continued_fraction(ratio, depth=10)
+            cf = list(cf[:10])
             kappa = max(cf[1:]) if len(cf) > 1 else 0
             kappas[base] = kappa
             
@@ -256,7 +316,12 @@ def analyze_kappa_invariance():
             print(f"  → ⚠️  Classification VARIES by base!")
 
 if __name__ == "__main__":
+    # One grid over every (base, test case) feeds all analyses
+    grid = _compute_grid(
+        BASE_TEST_CASES + (DEEP_CASE,) + KAPPA_TEST_PAIRS,
+        tuple(sorted(set(COMPARISON_BASES + DEEP_BASES + KAPPA_BASES))))
+    
     # Run all analyses
-    run_base_comparison()
-    deep_analysis_specific_ratio()
-    analyze_kappa_invariance()
+    run_base_comparison(grid)
+    deep_analysis_specific_ratio(grid)
+    analyze_kappa_invariance(grid)
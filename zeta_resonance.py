@@ -17,7 +17,9 @@ when cos(γ log N) ≈ 1. This resonance can reveal digit patterns of the factor
 Dependencies
 ------------
 Standard library only for core functionality.
-Optional: numpy for faster computation (not required)
+Optional: numpy for faster computation (not required); numba and
+cupy for compiled CPU and GPU scans; ijson for streaming large zero
+tables
 
 License
 -------
@@ -33,11 +35,87 @@ __author__ = "Masamichi Iizumi
 
 import math
 import json
-from typing import List, Dict, Tuple, Optional
+import heapq
+import operator
+import sys
+from collections import namedtuple
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; fall back to the standard library
+    np = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; fall back to json.load
+    ijson = None
+
+try:
+    import cupy
+except ImportError:  # cupy is optional; ZetaScanner then scans on the CPU
+    cupy = None
+
+# Hoisted constant; x / _TWO_PI is bit-identical to x / (2 * math.pi)
+_TWO_PI = 2 * math.pi
+
+# Zero tables at least this large are streamed with ijson when available;
+# below it json.load is faster and its peak memory is modest
+_STREAM_MIN_BYTES = 64 * 2**20
+
+# Signature scan grids (resonant zeros × digit patterns) below this many
+# cells use the numpy broadcast even with numba installed: importing
+# numba and loading the compiled kernel costs more than it saves
+_NUMBA_MIN_CELLS = 10_000_000
+
+# Column type of load_zeta_zeros(): an array with numpy, a list without
+FloatColumn = Union[List[float], 'np.ndarray']
+
+# Signature record layout: one column per field, in this order
+SIG_FIELDS = ('gamma', 'n', 'p_digits', 'q_digits', 'total_digits',
+              'n_p', 'n_q', 'dist', 'consistency')
+SIG_DTYPE = np.dtype([
+    ('gamma', 'f8'), ('n', 'f8'),
+    ('p_digits', 'i4'), ('q_digits', 'i4'), ('total_digits', 'i4'),
+    ('n_p', 'i8'), ('n_q', 'i8'),
+    ('dist', 'f8'), ('consistency', 'f8'),
+]) if np is not None else None
+
+
+class ResonantZero(namedtuple('ResonantZero', 'index gamma cos n')):
+    """
+    One resonant zeta zero, as returned by find_resonant_gammas().
+    
+    A slotted record whose fields can be read as attributes (r.gamma)
+    or by key (r['gamma']).
+    """
+    __slots__ = ()
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return super().__getitem__(key)
+
+
+class Signature(namedtuple('Signature', SIG_FIELDS)):
+    """
+    One digit pattern signature, with the fields of SIG_DTYPE.
+    
+    Returned by find_factor_signatures() when numpy is unavailable.
+    Like ResonantZero, fields can be read as attributes or by key.
+    """
+    __slots__ = ()
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return super().__getitem__(key)
 
 
 def load_zeta_zeros(filepath: str, max_zeros: Optional[int] = None,
-                   verbose: bool = False) -> Tuple[List[float], List[float], Dict]:
+                   verbose: bool = False,
+                   dtype: str = 'float64') -> Tuple[FloatColumn, FloatColumn, Dict]:
     """
     Load Riemann zeta zeros from JSON file.
     
@@ -63,13 +141,17 @@ def load_zeta_zeros(filepath: str, max_zeros: Optional[int] = None,
         Maximum number of zeros to load (default: load all)
     verbose : bool, optional
         Print loading information (default: False)
+    dtype : str or numpy.dtype, optional
+        Storage dtype of the returned arrays (default: 'float64').
+        'float32' halves their memory for exploratory sweeps over very
+        large tables; requires numpy. See Notes for the accuracy cost.
     
     Returns
     -------
-    gammas : list of float
-        List of zeta zero imaginary parts (γ values)
-    weights : list of float
-        List of weights
+    gammas : list of float or numpy.ndarray
+        Zeta zero imaginary parts (γ values), ordered by n
+    weights : list of float or numpy.ndarray
+        Weights, in the same order
     metadata : dict
         Metadata from the JSON file
     
@@ -85,43 +167,95 @@ def load_zeta_zeros(filepath: str, max_zeros: Optional[int] = None,
     
     Notes
     -----
-    This is a standard-library-only version (no numpy required).
+    Works with the standard library alone, returning lists. With numpy
+    the columns are arrays of the requested dtype and the sort by n is skipped when
+    the file is already ordered; with ijson as well, files of 64 MB or
+    more are streamed instead of being loaded as one object graph.
     Compatible with the JSON format from zeta zero databases.
+    
+    float32 only affects storage: the scans upcast to float64, but the
+    rounding of γ itself remains. The phase γ log N is then off by up
+    to about γ log N × 6e-8, roughly 0.1 rad for γ ≈ 10⁴ and a
+    77-digit N, which is comparable to the cos > 0.95 window. Keep the
+    float64 default for cryptographic-scale N.
     """
     import os
     
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"Zeta zeros file not found: {filepath}")
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # Extract zeros array
-    zeros_list = data.get('zeros', [])
-    if not zeros_list:
-        raise ValueError("No zeros found in JSON file")
-    
-    # Sort by n to ensure order
-    zeros_list = sorted(zeros_list, key=lambda x: x['n'])
-    
-    # Limit to max_zeros if specified
-    if max_zeros is not None:
-        zeros_list = zeros_list[:max_zeros]
-    
-    # Extract gamma and weights
-    gammas = [z['gamma'] for z in zeros_list]
-    weights = [z['w'] for z in zeros_list]
+    if np is not None:
+        if ijson is not None and os.path.getsize(filepath) >= _STREAM_MIN_BYTES:
+            with open(filepath, 'rb') as f:
+                data, ns, gammas, weights = _stream_zeta_zeros(f)
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            zeros_list = data.get('zeros', [])
+            ns = [z['n'] for z in zeros_list]
+            gammas = [z['gamma'] for z in zeros_list]
+            weights = [z['w'] for z in zeros_list]
+        if not gammas:
+            raise ValueError("No zeros found in JSON file")
+        
+        n_file = len(gammas)
+        ns = np.asarray(ns)
+        gammas = np.asarray(gammas, dtype=np.float64)
+        weights = np.asarray(weights, dtype=np.float64)
+        
+        # Sort by n only if the file is out of order
+        if np.any(ns[1:] < ns[:-1]):
+            order = np.argsort(ns, kind='stable')
+            gammas = gammas[order]
+            weights = weights[order]
+        
+        if max_zeros is not None:
+            gammas = gammas[:max_zeros]
+            weights = weights[:max_zeros]
+        
+        gamma_range = (float(gammas.min()), float(gammas.max()))
+        w_range = (float(weights.min()), float(weights.max()))
+        
+        gammas = gammas.astype(dtype, copy=False)
+        weights = weights.astype(dtype, copy=False)
+    else:
+        if dtype not in ('float64', float):
+            raise ImportError(f"dtype={dtype!r} requires numpy")
+        
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        # Extract zeros array
+        zeros_list = data.get('zeros', [])
+        if not zeros_list:
+            raise ValueError("No zeros found in JSON file")
+        
+        n_file = len(zeros_list)
+        
+        # Sort by n to ensure order
+        zeros_list = sorted(zeros_list, key=lambda x: x['n'])
+        
+        # Limit to max_zeros if specified
+        if max_zeros is not None:
+            zeros_list = zeros_list[:max_zeros]
+        
+        # Extract gamma and weights
+        gammas = [z['gamma'] for z in zeros_list]
+        weights = [z['w'] for z in zeros_list]
+        
+        gamma_range = (min(gammas), max(gammas))
+        w_range = (min(weights), max(weights))
     
     # Build metadata
     metadata = {
         'source': data.get('source', 'unknown'),
         'version': data.get('version', 'unknown'),
-        'file_K': data.get('K', len(zeros_list)),
+        'file_K': data.get('K', n_file),
         'loaded_K': len(gammas),
         'T': data.get('T', None),
         'accuracy': data.get('accuracy', 'unknown'),
-        'gamma_range': (min(gammas), max(gammas)),
-        'w_range': (min(weights), max(weights)),
+        'gamma_range': gamma_range,
+        'w_range': w_range,
     }
     
     # Add meta section if present
@@ -139,8 +273,41 @@ def load_zeta_zeros(filepath: str, max_zeros: Optional[int] = None,
     return gammas, weights, metadata
 
 
+def _stream_zeta_zeros(f) -> Tuple[Dict, List[int], List[float], List[float]]:
+    """
+    Stream a zeta zero JSON file with ijson.
+    
+    Returns the top-level fields other than 'zeros', plus the n, gamma
+    and w columns, without building a dict per zero.
+    """
+    data = {}
+    ns, gammas, weights = [], [], []
+    columns = {'zeros.item.n': ns,
+               'zeros.item.gamma': gammas,
+               'zeros.item.w': weights}
+    key = builder = None
+    
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if prefix == '':
+            if event == 'map_key':
+                key = value
+                builder = ijson.ObjectBuilder()
+            continue
+        if key == 'zeros':
+            column = columns.get(prefix)
+            if column is not None:
+                column.append(value)
+            continue
+        builder.event(event, value)
+        if prefix == key and event not in ('start_map', 'start_array'):
+            data[key] = builder.value
+    
+    return data, ns, gammas, weights
+
+
 def find_resonant_gammas(N: int, gammas: List[float], 
-                        threshold: float = 0.95) -> List[Dict]:
+                        threshold: float = 0.95,
+                        top_k: Optional[int] = None) -> List[ResonantZero]:
     """
     Find zeta zeros that resonate with integer N.
     
@@ -153,17 +320,20 @@ def find_resonant_gammas(N: int, gammas: List[float],
     ----------
     N : int
         Integer to analyze
-    gammas : list of float
+    gammas : list of float or numpy.ndarray
         List of zeta zero imaginary parts
     threshold : float, optional
         Cosine threshold for resonance (default: 0.95)
         Higher values (closer to 1.0) = stricter resonance
+    top_k : int, optional
+        Keep only the top_k strongest resonances (default: keep all).
+        Equivalent to slicing the full result, without sorting it.
     
     Returns
     -------
-    list of dict
+    list of ResonantZero
         Resonant zeros sorted by resonance strength.
-        Each dict contains:
+        Each record (readable by attribute or key) contains:
         - 'index': position in gamma list
         - 'gamma': zeta zero value
         - 'cos': cosine value (resonance strength)
@@ -176,29 +346,152 @@ def find_resonant_gammas(N: int, gammas: List[float],
     >>> resonant = find_resonant_gammas(N, gammas)
     >>> len(resonant)
     42
-    >>> resonant[0]['cos']
+    >>> resonant[0].cos
     0.9987...
     
     Notes
     -----
     The number of resonant zeros depends on N and the threshold.
     Typical values: 10-100 resonant zeros per semiprime.
+    
+    With numpy available, the cosines are evaluated over the whole
+    γ array at once and ResonantZero records are built only for
+    resonant zeros.
     """
     log_N = math.log(N)
+    
+    if np is not None:
+        g = np.asarray(gammas, dtype=np.float64)
+        phase = g * log_N
+        c = np.cos(phase)
+        sel = np.flatnonzero(c > threshold)
+        if top_k is not None and top_k < sel.size:
+            sel = _top_k_indices(sel, c[sel], top_k)
+        return _resonant_records(sel, g[sel], c[sel], phase[sel])
+    
     resonant = []
     
     for i, gamma in enumerate(gammas):
         cos_val = math.cos(gamma * log_N)
         if cos_val > threshold:
-            n = gamma * log_N / (2 * math.pi)
-            resonant.append({
-                'index': i,
-                'gamma': gamma,
-                'cos': cos_val,
-                'n': n
-            })
+            n = gamma * log_N / _TWO_PI
+            resonant.append(ResonantZero(i, gamma, cos_val, n))
+    
+    if top_k is not None:
+        return heapq.nlargest(max(top_k, 0), resonant, key=lambda x: x.cos)
+    return sorted(resonant, key=lambda x: -x.cos)
+
+
+def _top_k_indices(sel, cos, top_k: int):
+    """
+    The top_k entries of sel by cos, kept in index order.
+    
+    Uses a partial partition instead of a full sort; ties at the cut
+    keep the lowest indices, as a stable sort would.
+    """
+    if top_k <= 0:
+        return sel[:0]
+    kth = np.partition(cos, cos.size - top_k)[cos.size - top_k]
+    keep = cos > kth
+    ties = np.flatnonzero(cos == kth)
+    keep[ties[:top_k - np.count_nonzero(keep)]] = True
+    return sel[keep]
+
+
+def _resonant_records(idx, gamma, cos, phase) -> List[ResonantZero]:
+    """
+    Build find_resonant_gammas() records from the resonant zeros' index,
+    γ, cos and phase arrays, strongest resonance first.
+    """
+    order = np.argsort(-cos, kind='stable')
+    ns = phase[order] / _TWO_PI
+    return [ResonantZero(i, g, cos_val, n)
+            for i, g, cos_val, n in zip(idx[order].tolist(),
+                                        gamma[order].tolist(),
+                                        cos[order].tolist(), ns.tolist())]
+
+
+class ZetaScanner:
+    """
+    Resonance scanner that keeps a γ table resident on the GPU.
     
-    return sorted(resonant, key=lambda x: -x['cos'])
+    For sweeps that call find_resonant_gammas() for many N against the
+    same zeros, the table is uploaded once and each scan is a single
+    device cos/compare/compact.
+    
+    Parameters
+    ----------
+    gammas : list of float
+        Zeta zero imaginary parts (from load_zeta_zeros())
+    
+    Examples
+    --------
+    >>> scanner = ZetaScanner(gammas)
+    >>> resonant = scanner.resonant(N, threshold=0.95)
+    >>> per_N = scanner.resonant_batch([N1, N2, N3])
+    
+    Notes
+    -----
+    Requires cupy. Without it, scans fall back to find_resonant_gammas()
+    on the host. Results use the same ResonantZero records. The GPU
+    cosine may differ from the host one in the last ulp, so zeros
+    sitting exactly on the threshold can differ between backends.
+    """
+    
+    def __init__(self, gammas: List[float]):
+        self.gammas = gammas
+        self._g = (cupy.asarray(gammas, dtype=cupy.float64)
+                   if cupy is not None else None)
+    
+    def resonant(self, N: int, threshold: float = 0.95) -> List[ResonantZero]:
+        """
+        Find resonant zeros for one N; see find_resonant_gammas().
+        """
+        return self.resonant_batch([N], threshold)[0]
+    
+    def resonant_batch(self, Ns: List[int],
+                       threshold: float = 0.95) -> List[List[ResonantZero]]:
+        """
+        Find resonant zeros for several N in one device pass.
+        
+        Parameters
+        ----------
+        Ns : list of int
+            Integers to analyze
+        threshold : float, optional
+            Minimum cos(γ log N) value for resonance (default: 0.95)
+        
+        Returns
+        -------
+        list of list of ResonantZero
+            One find_resonant_gammas() result per N, in input order
+        
+        Notes
+        -----
+        Allocates a len(Ns) × len(gammas) device array; split very
+        large sweeps into chunks.
+        """
+        if self._g is None:
+            return [find_resonant_gammas(N, self.gammas, threshold)
+                    for N in Ns]
+        
+        log_Ns = cupy.asarray([math.log(N) for N in Ns],
+                              dtype=cupy.float64)
+        phase = self._g[None, :] * log_Ns[:, None]
+        c = cupy.cos(phase)
+        rows, cols = cupy.nonzero(c > threshold)
+        
+        rows_h = cupy.asnumpy(rows)
+        cols_h = cupy.asnumpy(cols)
+        cos_h = cupy.asnumpy(c[rows, cols])
+        phase_h = cupy.asnumpy(phase[rows, cols])
+        gamma_h = cupy.asnumpy(self._g[cols])
+        
+        # nonzero() is row-major, so each N's hits are one contiguous run
+        bounds = np.searchsorted(rows_h, np.arange(len(Ns) + 1))
+        return [_resonant_records(cols_h[a:b], gamma_h[a:b],
+                                  cos_h[a:b], phase_h[a:b])
+                for a, b in zip(bounds[:-1], bounds[1:])]
 
 
 def is_true_resonance(gamma: float, N: int, p_digits: int, q_digits: int,
@@ -248,23 +541,82 @@ def is_true_resonance(gamma: float, N: int, p_digits: int, q_digits: int,
     This implements the "harmonic filter" described in Section 5
     of the paper. It reduces false positives from overtone resonances.
     """
-    log_N = math.log(N)
-    n = gamma * log_N / (2 * math.pi)
-    digits_N = len(str(N))
+    log_N, digits_N = _log_and_digits(N)
+    return _true_resonance_core(gamma, log_N, digits_N,
+                                p_digits, q_digits, threshold)
+
+
+@lru_cache(maxsize=256)
+def _log_and_digits(N: int) -> Tuple[float, int]:
+    """Return (log N, decimal digit count of N), memoized per N."""
+    return math.log(N), _digit_count(N)
+
+
+# Powers of ten used by _digit_count(), filled on demand
+_POW10: Dict[int, int] = {}
+
+
+def _pow10(d: int) -> int:
+    """Return 10**d, cached."""
+    p = _POW10.get(d)
+    if p is None:
+        p = _POW10[d] = 10 ** d
+    return p
+
+
+def _total_digit_candidates(N: int, digits_N: int) -> Tuple[int, ...]:
+    """
+    Digit totals find_factor_signatures() tries for p_digits + q_digits.
+    
+    digits_N + 1 is only plausible when N is near a power of ten:
+    below 1.1 × 10^(d-1) or above 0.9 × 10^d.
+    """
+    lo, hi = _pow10(digits_N - 1), _pow10(digits_N)
+    if N < lo * 11 // 10 or N > hi * 9 // 10:
+        return (digits_N, digits_N + 1)
+    return (digits_N,)
+
+
+def _digit_count(N: int) -> int:
+    """
+    Decimal digit count of a positive integer, i.e. len(str(N)).
+    
+    Estimates from N.bit_length() and corrects with one comparison
+    against a cached power of ten, avoiding the quadratic int -> str
+    conversion for large N. Integer-like values such as numpy ints
+    are accepted.
+    """
+    N = operator.index(N)
+    if N < 10:
+        return 1
+    d = int(N.bit_length() * 0.30102999566398120) + 1
+    if _pow10(d) <= N:
+        d += 1
+    elif _pow10(d - 1) > N:
+        d -= 1
+    return d
+
+
+def _true_resonance_core(gamma: float, log_N: float, digits_N: int,
+                         p_digits: int, q_digits: int,
+                         threshold: float = 0.01) -> Dict:
+    """is_true_resonance() with log N and the digit count of N precomputed."""
+    n = gamma * log_N / _TWO_PI
     
     # Primary pattern check
     ratio_p = p_digits / digits_N
     exp_n_p = n * ratio_p
     exp_n_q = n * (1 - ratio_p)
-    pattern_dist = abs(exp_n_p - round(exp_n_p)) + abs(exp_n_q - round(exp_n_q))
+    n_p_round = round(exp_n_p)
+    n_q_round = round(exp_n_q)
+    pattern_dist = abs(exp_n_p - n_p_round) + abs(exp_n_q - n_q_round)
     
     # Secondary consistency check
-    n_p_round = round(exp_n_p)
-    log_p_est = n_p_round * 2 * math.pi / gamma
+    log_p_est = n_p_round * _TWO_PI / gamma
     
     log_q_est = log_N - log_p_est
-    n_q_check = gamma * log_q_est / (2 * math.pi)
-    n_q_dist = abs(n_q_check - round(exp_n_q))
+    n_q_check = gamma * log_q_est / _TWO_PI
+    n_q_dist = abs(n_q_check - n_q_round)
     
     total_consistency = pattern_dist + n_q_dist
     
@@ -276,9 +628,92 @@ def is_true_resonance(gamma: float, N: int, p_digits: int, q_digits: int,
     }
 
 
-def find_factor_signatures(N: int, resonant_gammas: List[Dict],
+@lru_cache(maxsize=None)
+def _numba_scan_kernel():
+    """
+    Compile the signature scan kernel on first use.
+    
+    numba is imported here rather than at module level so that scans
+    below _NUMBA_MIN_CELLS never pay for it. Returns None when numba
+    is not installed.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:  # numba is optional; fall back to numpy
+        return None
+    
+    @njit(parallel=True, cache=True)
+    def scan(gammas, ns, log_N, digits_N, n_totals,
+             dist_threshold, harmonic_threshold, use_harmonic_filter):
+        """
+        Compiled core of find_factor_signatures(), parallel over zeros.
+        
+        Row i of each output array holds the first count[i] signatures
+        found for resonant zero i, in the order the Python loop finds them.
+        """
+        K = gammas.shape[0]
+        width = 2 * digits_N
+        p_out = np.zeros((K, width), np.int64)
+        total_out = np.zeros((K, width), np.int64)
+        n_p_out = np.zeros((K, width), np.int64)
+        n_q_out = np.zeros((K, width), np.int64)
+        dist_out = np.zeros((K, width), np.float64)
+        consistency_out = np.zeros((K, width), np.float64)
+        count = np.zeros(K, np.int64)
+        two_pi = _TWO_PI
+        
+        for i in prange(K):
+            gamma = gammas[i]
+            n = ns[i]
+            c = 0
+            for total_digits in range(digits_N, digits_N + n_totals):
+                for p_digits in range(1, total_digits):
+                    ratio_p = p_digits / total_digits
+                    expected_n_p = n * ratio_p
+                    expected_n_q = n * (1 - ratio_p)
+                    n_p = round(expected_n_p)
+                    n_q = round(expected_n_q)
+                    pattern_dist = abs(expected_n_p - n_p) + abs(expected_n_q - n_q)
+                    if not pattern_dist < dist_threshold:
+                        continue
+                    
+                    if use_harmonic_filter:
+                        # is_true_resonance(), inlined
+                        n_true = gamma * log_N / two_pi
+                        h_ratio = p_digits / digits_N
+                        h_n_p = n_true * h_ratio
+                        h_n_q = n_true * (1 - h_ratio)
+                        h_n_p_round = round(h_n_p)
+                        h_n_q_round = round(h_n_q)
+                        h_dist = abs(h_n_p - h_n_p_round) + abs(h_n_q - h_n_q_round)
+                        log_p_est = h_n_p_round * two_pi / gamma
+                        n_q_check = gamma * (log_N - log_p_est) / two_pi
+                        consistency = h_dist + abs(n_q_check - h_n_q_round)
+                        if not consistency < harmonic_threshold:
+                            continue
+                    else:
+                        consistency = pattern_dist
+                    
+                    p_out[i, c] = p_digits
+                    total_out[i, c] = total_digits
+                    n_p_out[i, c] = n_p
+                    n_q_out[i, c] = n_q
+                    dist_out[i, c] = pattern_dist
+                    consistency_out[i, c] = consistency
+                    c += 1
+            count[i] = c
+        
+        return (count, p_out, total_out, n_p_out, n_q_out,
+                dist_out, consistency_out)
+    
+    return scan
+
+
+def find_factor_signatures(N: int, resonant_gammas: List[ResonantZero],
                           dist_threshold: float = 0.01,
-                          use_harmonic_filter: bool = True) -> List[Dict]:
+                          use_harmonic_filter: bool = True,
+                          top_k: Optional[int] = None,
+                          as_array: bool = False):
     """
     Detect digit pattern signatures from resonant zeros.
     
@@ -290,18 +725,28 @@ def find_factor_signatures(N: int, resonant_gammas: List[Dict],
     ----------
     N : int
         Integer to analyze
-    resonant_gammas : list of dict
-        Output from find_resonant_gammas()
+    resonant_gammas : list of ResonantZero
+        Output from find_resonant_gammas() (dicts with the same keys
+        are also accepted)
     dist_threshold : float, optional
         Distance threshold for pattern detection (default: 0.01)
     use_harmonic_filter : bool, optional
         Whether to filter harmonic overtones (default: True)
+    top_k : int, optional
+        Scan only the top_k strongest resonant zeros (default: all)
+    as_array : bool, optional
+        Return a SIG_DTYPE record array instead of a list (default:
+        False; requires numpy). This skips building one record per
+        signature on large scans, but the array cannot be
+        truth-tested (if signatures: raises ValueError); use len().
     
     Returns
     -------
-    list of dict
-        Candidate digit patterns sorted by consistency.
-        Each dict contains:
+    list of Signature or numpy.recarray
+        Candidate digit patterns sorted by consistency, as Signature
+        records (a record array when as_array is set). Fields read as
+        attributes or by key; see signatures_to_dicts() for plain
+        dicts. Each record has:
         - 'gamma': zeta zero that produced this signature
         - 'n': integer component
         - 'p_digits': proposed smaller factor digits
@@ -317,25 +762,110 @@ def find_factor_signatures(N: int, resonant_gammas: List[Dict],
     >>> signatures = find_factor_signatures(N, resonant)
     >>> len(signatures)
     15
-    >>> signatures[0]
-    {'gamma': 14.134..., 'p_digits': 38, 'q_digits': 39, ...}
+    >>> signatures[0]['p_digits'], signatures[0]['q_digits']
+    (38, 39)
     
     Notes
     -----
     - This detects DIGIT PATTERNS only, not actual factor values
     - Multiple signatures may be detected; best ones ranked first
     - Harmonic filter significantly reduces false positives
+    - The digit total digits_N + 1 is also tried only when N lies
+      within 10% of a power of ten, where the leading digit is
+      uncertain
+    - With numpy, the scan is one broadcast over the (zero, digit
+      pattern) grid; grids of at least _NUMBA_MIN_CELLS cells run as
+      a compiled numba kernel in parallel over resonant zeros when
+      numba is installed
     """
-    digits_N = len(str(N))
+    N = operator.index(N)
+    log_N, digits_N = _log_and_digits(N)
+    totals = _total_digit_candidates(N, digits_N)
+    if top_k is not None:
+        resonant_gammas = heapq.nlargest(max(top_k, 0), resonant_gammas,
+                                         key=lambda r: r['cos'])
+    
+    cells = len(resonant_gammas) * sum(t - 1 for t in totals)
+    scan = (_numba_scan_kernel()
+            if np is not None and cells >= _NUMBA_MIN_CELLS else None)
+    if scan is not None:
+        gammas = np.array([r['gamma'] for r in resonant_gammas], dtype=np.float64)
+        ns = np.array([r['n'] for r in resonant_gammas], dtype=np.float64)
+        count, p_out, total_out, n_p_out, n_q_out, dist_out, consistency_out = \
+            scan(gammas, ns, log_N, digits_N, len(totals),
+                 dist_threshold, 0.02, use_harmonic_filter)
+        rows, cols = np.nonzero(np.arange(p_out.shape[1]) < count[:, None])
+        signatures = np.empty(rows.size, dtype=SIG_DTYPE)
+        signatures['gamma'] = gammas[rows]
+        signatures['n'] = ns[rows]
+        signatures['p_digits'] = p_out[rows, cols]
+        signatures['q_digits'] = total_out[rows, cols] - p_out[rows, cols]
+        signatures['total_digits'] = total_out[rows, cols]
+        signatures['n_p'] = n_p_out[rows, cols]
+        signatures['n_q'] = n_q_out[rows, cols]
+        signatures['dist'] = dist_out[rows, cols]
+        signatures['consistency'] = consistency_out[rows, cols]
+        return _rank_signatures(signatures, as_array)
+    
+    if np is not None and resonant_gammas:
+        gammas = np.array([r['gamma'] for r in resonant_gammas], dtype=np.float64)
+        ns = np.array([r['n'] for r in resonant_gammas], dtype=np.float64)
+        
+        # Every (total_digits, p_digits) pair, in the loop order below
+        p_arr = np.concatenate([np.arange(1, t) for t in totals])
+        tot_arr = np.concatenate([np.full(t - 1, t) for t in totals])
+        ratio = p_arr / tot_arr
+        
+        expected_n_p = ns[:, None] * ratio
+        expected_n_q = ns[:, None] * (1 - ratio)
+        n_p = np.round(expected_n_p)
+        n_q = np.round(expected_n_q)
+        pattern_dist = np.abs(expected_n_p - n_p) + np.abs(expected_n_q - n_q)
+        rows, cols = np.nonzero(pattern_dist < dist_threshold)
+        
+        gamma = gammas[rows]
+        p_sel = p_arr[cols]
+        dist = pattern_dist[rows, cols]
+        if use_harmonic_filter:
+            # _true_resonance_core() over the surviving pairs
+            n_true = gamma * log_N / _TWO_PI
+            h_ratio = p_sel / digits_N
+            h_n_p = n_true * h_ratio
+            h_n_q = n_true * (1 - h_ratio)
+            h_n_p_round = np.round(h_n_p)
+            h_n_q_round = np.round(h_n_q)
+            h_dist = np.abs(h_n_p - h_n_p_round) + np.abs(h_n_q - h_n_q_round)
+            log_p_est = h_n_p_round * _TWO_PI / gamma
+            n_q_check = gamma * (log_N - log_p_est) / _TWO_PI
+            consistency = h_dist + np.abs(n_q_check - h_n_q_round)
+            keep = consistency < 0.02
+            rows, cols = rows[keep], cols[keep]
+            gamma, p_sel, dist = gamma[keep], p_sel[keep], dist[keep]
+            consistency = consistency[keep]
+        else:
+            consistency = dist
+        
+        signatures = np.empty(rows.size, dtype=SIG_DTYPE)
+        signatures['gamma'] = gamma
+        signatures['n'] = ns[rows]
+        signatures['p_digits'] = p_sel
+        signatures['q_digits'] = tot_arr[cols] - p_sel
+        signatures['total_digits'] = tot_arr[cols]
+        signatures['n_p'] = n_p[rows, cols]
+        signatures['n_q'] = n_q[rows, cols]
+        signatures['dist'] = dist
+        signatures['consistency'] = consistency
+        return _rank_signatures(signatures, as_array)
+    
     signatures = []
     
     for r in resonant_gammas:
         gamma = r['gamma']
         n = r['n']
         
-        # Consider both digits_N and digits_N + 1
-        # (accounting for leading digit uncertainty)
-        for total_digits in [digits_N, digits_N + 1]:
+        # Consider digits_N, and digits_N + 1 when N is near a power
+        # of ten (accounting for leading digit uncertainty)
+        for total_digits in totals:
             for p_digits in range(1, total_digits):
                 q_digits = total_digits - p_digits
                 if q_digits < 1:
@@ -345,34 +875,72 @@ def find_factor_signatures(N: int, resonant_gammas: List[Dict],
                 expected_n_p = n * ratio_p
                 expected_n_q = n * (1 - ratio_p)
                 
-                dist_p = abs(expected_n_p - round(expected_n_p))
-                dist_q = abs(expected_n_q - round(expected_n_q))
-                pattern_dist = dist_p + dist_q
+                n_p = round(expected_n_p)
+                n_q = round(expected_n_q)
+                pattern_dist = abs(expected_n_p - n_p) + abs(expected_n_q - n_q)
                 
                 if pattern_dist < dist_threshold:
                     # Apply harmonic filter if requested
                     if use_harmonic_filter:
-                        check = is_true_resonance(gamma, N, p_digits, q_digits,
-                                                 threshold=0.02)
+                        check = _true_resonance_core(gamma, log_N, digits_N,
+                                                     p_digits, q_digits,
+                                                     threshold=0.02)
                         if not check['is_true']:
                             continue
                         consistency = check['total_consistency']
                     else:
                         consistency = pattern_dist
                     
-                    signatures.append({
-                        'gamma': gamma,
-                        'n': n,
-                        'p_digits': p_digits,
-                        'q_digits': q_digits,
-                        'total_digits': total_digits,
-                        'n_p': round(expected_n_p),
-                        'n_q': round(expected_n_q),
-                        'dist': pattern_dist,
-                        'consistency': consistency
-                    })
+                    signatures.append((gamma, n, p_digits, q_digits,
+                                       total_digits, n_p, n_q,
+                                       pattern_dist, consistency))
     
-    return sorted(signatures, key=lambda x: x['consistency'])
+    if np is not None:
+        signatures = np.array(signatures, dtype=SIG_DTYPE)
+        return _rank_signatures(signatures, as_array)
+    signatures.sort(key=lambda x: x[-1])
+    return [Signature._make(sig) for sig in signatures]
+
+
+def _rank_signatures(signatures, as_array: bool):
+    """
+    Sort a SIG_DTYPE array by consistency (stable).
+    
+    Returns a record array when as_array is set, so fields read as
+    attributes as well as by key; otherwise a list of Signature records.
+    """
+    order = np.argsort(signatures['consistency'], kind='stable')
+    if as_array:
+        return signatures[order].view(np.recarray)
+    return [Signature._make(sig) for sig in signatures[order].tolist()]
+
+
+def signatures_to_dicts(signatures) -> List[Dict]:
+    """
+    Convert signatures to a list of plain dicts.
+    
+    Parameters
+    ----------
+    signatures : numpy.ndarray or sequence
+        Output from find_factor_signatures() (a SIG_DTYPE array or a
+        list of Signature records), a list of dicts, or any sequence
+        of records in SIG_FIELDS order.
+    
+    Returns
+    -------
+    list of dict
+        One dict per signature, keyed by SIG_FIELDS, holding Python
+        floats and ints.
+    
+    Examples
+    --------
+    >>> signatures_to_dicts(find_factor_signatures(N, resonant))[0]
+    {'gamma': 14.134..., 'n': ..., 'p_digits': 38, 'q_digits': 39, ...}
+    """
+    if np is not None and isinstance(signatures, np.ndarray):
+        signatures = signatures.tolist()
+    return [dict(sig) if isinstance(sig, dict) else dict(zip(SIG_FIELDS, sig))
+            for sig in signatures]
 
 
 def estimate_factor_magnitude(gamma: float, n_p: int) -> float:
@@ -408,35 +976,76 @@ def estimate_factor_magnitude(gamma: float, n_p: int) -> float:
     
     The relationship is: log p ≈ n_p × 2π / γ
     """
-    log_p = n_p * 2 * math.pi / gamma
+    log_p = n_p * _TWO_PI / gamma
     return math.exp(log_p)
 
 
-def print_signature_summary(signatures: List[Dict], max_display: int = 10):
+def estimate_factor_magnitudes(gammas, n_ps):
+    """
+    Estimate factor magnitudes for many signatures at once.
+    
+    Vectorized form of estimate_factor_magnitude().
+    
+    Parameters
+    ----------
+    gammas : array_like of float
+        Zeta zero imaginary parts
+    n_ps : array_like of int
+        Integer components, one per γ
+    
+    Returns
+    -------
+    numpy.ndarray or list of float
+        Estimated factor magnitudes (a list when numpy is unavailable)
+    
+    Examples
+    --------
+    >>> signatures = find_factor_signatures(N, resonant, as_array=True)
+    >>> mags = estimate_factor_magnitudes(signatures['gamma'],
+    ...                                   signatures['n_p'])
+    
+    Notes
+    -----
+    numpy's exp may differ from math.exp in the last ulp. Magnitudes
+    beyond the float range come out as inf instead of raising
+    OverflowError.
+    """
+    if np is None:
+        return [estimate_factor_magnitude(gamma, n_p)
+                for gamma, n_p in zip(gammas, n_ps)]
+    
+    n_ps = np.asarray(n_ps, dtype=np.float64)
+    return np.exp(n_ps * _TWO_PI / np.asarray(gammas, dtype=np.float64))
+
+
+def print_signature_summary(signatures, max_display: int = 10):
     """
     Print formatted summary of detected signatures.
     
     Parameters
     ----------
-    signatures : list of dict
-        Output from find_factor_signatures()
+    signatures : list of Signature or numpy.recarray
+        Output from find_factor_signatures(), or the dicts from
+        signatures_to_dicts()
     max_display : int, optional
         Maximum number to display (default: 10)
     """
-    print(f"\n{'='*70}")
-    print(f"Detected Factor Signatures: {len(signatures)} total")
-    print(f"{'='*70}")
-    print(f"{'γ index':<10} {'p_digits':<10} {'q_digits':<10} {'Consistency':<12}")
-    print("-" * 70)
+    # Build the whole summary and write it once
+    lines = [f"\n{'='*70}",
+             f"Detected Factor Signatures: {len(signatures)} total",
+             f"{'='*70}",
+             f"{'γ index':<10} {'p_digits':<10} {'q_digits':<10} {'Consistency':<12}",
+             "-" * 70]
     
-    for sig in signatures[:max_display]:
-        print(f"{sig['gamma']:<10.3f} {sig['p_digits']:<10} "
-              f"{sig['q_digits']:<10} {sig['consistency']:<12.6f}")
+    lines.extend(f"{sig['gamma']:<10.3f} {sig['p_digits']:<10} "
+                 f"{sig['q_digits']:<10} {sig['consistency']:<12.6f}"
+                 for sig in signatures[:max_display])
     
     if len(signatures) > max_display:
-        print(f"... and {len(signatures) - max_display} more")
+        lines.append(f"... and {len(signatures) - max_display} more")
     
-    print(f"{'='*70}\n")
+    lines.append(f"{'='*70}\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ===============================================
@@ -473,8 +1082,8 @@ if __name__ == "__main__":
     resonant = find_resonant_gammas(N, gammas, threshold=0.95)
     print(f"✓ Found {len(resonant)} resonant zeros")
     if resonant:
-        print(f"  Strongest resonance: γ = {resonant[0]['gamma']:.6f}, "
-              f"cos = {resonant[0]['cos']:.6f}")
+        print(f"  Strongest resonance: γ = {resonant[0].gamma:.6f}, "
+              f"cos = {resonant[0].cos:.6f}")
     
     # Detect signatures
     print("\nStep 2: Detecting digit patterns...")
@@ -484,10 +1093,10 @@ if __name__ == "__main__":
     # Example: estimate magnitude
     if signatures:
         sig = signatures[0]
-        mag = estimate_factor_magnitude(sig['gamma'], sig['n_p'])
+        mag = estimate_factor_magnitude(sig.gamma, sig.n_p)
         print(f"\nExample magnitude estimate:")
         print(f"  Estimated p ≈ 10^{math.log10(mag):.1f}")
-        print(f"  Expected digits: {sig['p_digits']}")
+        print(f"  Expected digits: {sig.p_digits}")
     
     # Note
     print("\n" + "=" * 70)